@@ -0,0 +1,41 @@
+"""
+预编译Logistic映射迭代内核
+
+在仓库根目录运行 python scripts/build_kernels.py，会在src目录下生成
+logistic_kernels扩展模块，src/logistic_map_student.py 导入时优先使用该模块，
+从而省去numba的JIT编译时间；扩展模块不存在时自动回退到JIT版本。
+AOT编译不支持并行，分岔图内核在此按r值串行迭代。
+"""
+
+import os
+
+import numpy as np
+from numba.pycc import CC
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+cc = CC('logistic_kernels')
+cc.output_dir = SRC_DIR
+
+@cc.export('iterate', 'f8[:](f8, f8, i8)')
+def iterate(r, x0, n):
+    x = np.empty(n)
+    x[0] = x0
+    for i in range(1, n):
+        x[i] = r * x[i-1] * (1 - x[i-1])
+    return x
+
+@cc.export('bifurcation_orbits', 'void(f8[:], i8, i8, f8[:, :])')
+def bifurcation_orbits(r_values, n_iterations, n_discard, out):
+    # out[k, j]为第j个r值的第n_discard+k次迭代
+    for j in range(r_values.size):
+        r = r_values[j]
+        x = 0.5
+        for i in range(n_discard):
+            x = r * x * (1.0 - x)
+        for k in range(n_iterations - n_discard):
+            out[k, j] = x
+            x = r * x * (1.0 - x)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -63,17 +63,17 @@ def plot_bifurcation(r_min, r_max, n_r, n_iterations, n_discard):
     """
     r = np.linspace(r_min, r_max, n_r)
     x = np.zeros(n_iterations)
-    x_plot = []
-    r_plot = []
+    keep = n_iterations - n_discard
+    r_plot = np.repeat(r, keep)
+    x_plot = np.empty(n_r * keep)
     
-    for r_val in r:
+    for idx, r_val in enumerate(r):
         x[0] = 0.5
         for i in range(1, n_iterations):
             x[i] = r_val * x[i-1] * (1 - x[i-1])
         
         # 只保留稳定后的点
-        x_plot.extend(x[n_discard:])
-        r_plot.extend([r_val] * (n_iterations - n_discard))
+        x_plot[idx*keep:(idx+1)*keep] = x[n_discard:]
     
     fig, ax = plt.subplots(figsize=(12, 8))
     ax.plot(r_plot, x_plot, ',k', alpha=0.1, markersize=0.1)
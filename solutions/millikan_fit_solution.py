@@ -27,8 +27,8 @@ def calculate_parameters(x, y):
     N = len(x)
     Ex = np.mean(x)
     Ey = np.mean(y)
-    Exx = np.mean(x**2)
-    Exy = np.mean(x*y)
+    Exx = x.dot(x) / x.size
+    Exy = x.dot(y) / x.size
     
     denominator = Exx - Ex**2
     if denominator == 0:
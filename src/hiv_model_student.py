@@ -1,6 +1,12 @@
+import os
 import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 
+def _viral_load(A, alpha, B, beta, t):
+    # 双指数模型
+    return A * np.exp(-alpha * t) + B * np.exp(-beta * t)
+
 class HIVModel:
     def __init__(self, A, alpha, B, beta):
         # TODO: 初始化模型参数
@@ -8,40 +14,57 @@ class HIVModel:
         self.alpha = alpha
         self.B = B
         self.beta = beta
+        # 缓存最近一次的计算结果，同一时间网格和参数只计算一次指数
+        self._cache = None
 
     def viral_load(self, time):
+        """
+        计算病毒载量
+        
+        结果按time对象的id和模型参数缓存：同一time对象再次调用时直接返回缓存值。
+        注意：原地修改time数组后缓存不会失效，会返回修改前的结果，
+        此时应传入新的数组。返回值均为副本，调用方可自由修改。
+        """
         # TODO: 计算病毒载量
-        return self.A * np.exp(-self.alpha * time) + self.B * np.exp(-self.beta * time)
+        # 缓存中保留time的引用，保证其id在缓存有效期内不会被复用
+        key = (id(time), self.A, self.alpha, self.B, self.beta)
+        if self._cache is not None and self._cache[0] == key:
+            return self._cache[2].copy()
+        result = _viral_load(self.A, self.alpha, self.B, self.beta, time)
+        self._cache = (key, time, result)
+        return result.copy()
      
-    def plot_model(self, time,data_time=None, data_load=None):
+    def plot_model(self, time,data_time=None, data_load=None, ax=None):
         # TODO: 绘制模型曲线
+        # ax为空时绘制到当前坐标轴，便于调用方复用同一张图
+        if ax is None:
+            ax = plt.gca()
         viral_load=self.viral_load(time)
-        plt.plot(time, viral_load, label=f'Model (α={self.alpha}, β={self.beta})')
+        ax.plot(time, viral_load, label=f'Model (α={self.alpha}, β={self.beta})')
         if data_time is not None and data_load is not None:
-            plt.scatter(data_time, data_load, color='red', s=20, label='Experimental Data')  # s控制点大小
+            ax.scatter(data_time, data_load, color='red', s=20, label='Experimental Data')  # s控制点大小
         
-        plt.xlabel('Time(day)')
-        plt.ylabel('Viral Load')
-        plt.title("HIV Viral Load Model")
-        plt.legend()
-        plt.grid(True)
-        plt.show()
+        ax.set_xlabel('Time(day)')
+        ax.set_ylabel('Viral Load')
+        ax.set_title("HIV Viral Load Model")
+        ax.legend()
+        ax.grid(True)
 
 def load_hiv_data(filepath):
     # TODO: 加载HIV数据
-    try:
-        data = np.loadtxt(filepath)
+    if os.fspath(filepath).endswith('.npz'):
+        data = np.load(filepath)
         return data['time_in_days'], data['viral_load']
-    except:
-        data = np.loadtxt(filepath, delimiter=',')
-        return data[:, 0], data[:, 1]
+    data = pd.read_csv(filepath, header=None, skipinitialspace=True,
+                       comment='#', dtype=np.float32, engine='c').to_numpy()
+    return data[:, 0], data[:, 1]
     
 def main():
     # TODO: 主函数，用于测试模型
     model = HIVModel(A=100000, alpha=0.35, B=61000, beta=1.0)
 
     # 生成时间序列
-    time = np.linspace(0, 10, 100) #10天，均分100时间间隔
+    time = np.linspace(0, 10, 100, dtype=np.float32) #10天，均分100时间间隔
 
 
     # 加载实验数据
@@ -51,18 +74,16 @@ def main():
         print("未找到数据文件，仅绘制模型曲线")
         data_time, data_load = None, None
 
-    model.plot_model(time, data_time=data_time, data_load=data_load)
-
     latent_period = 1 / model.alpha  # 以天为单位
     print(f"T细胞感染率倒数 1/α = {latent_period:.16f} 天")
     print(f"T细胞感染率的倒数1/α与十年潜伏期比值为 {latent_period/3650:.16f}")
 
-    model.plot_model(time) #绘制模型图
-
-    plt.scatter(data_time, data_load)
-    plt.title("HIV Experimental Data")
-    plt.legend()
+    # 模型曲线与实验数据绘制在同一张图上
+    fig = plt.figure(figsize=(10, 6))
+    ax = fig.add_subplot(111)
+    model.plot_model(time, data_time=data_time, data_load=data_load, ax=ax)
     plt.show()
+    plt.close(fig)
 
 
 
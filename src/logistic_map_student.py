@@ -1,44 +1,78 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.colors import LogNorm
 
-def iterate_logistic(r, x0, n):
-    """
-    迭代Logistic映射
-    
-    参数:
-        r: 增长率参数
-        x0: 初始值
-        n: 迭代次数
+try:
+    # 优先使用 scripts/build_kernels.py 预编译的扩展模块，省去JIT编译时间；
+    # 作为脚本直接运行时src目录位于sys.path中，按顶层模块导入
+    if __package__:
+        from .logistic_kernels import iterate as iterate_logistic
+        from .logistic_kernels import bifurcation_orbits as _bifurcation_orbits
+    else:
+        from logistic_kernels import iterate as iterate_logistic
+        from logistic_kernels import bifurcation_orbits as _bifurcation_orbits
+except ImportError:
+    # 未预编译时回退到numba JIT，首次调用时编译
+    from numba import njit, prange
+
+    @njit(fastmath=True)
+    def iterate_logistic(r, x0, n):
+        """
+        迭代Logistic映射
         
-    返回:
-        x: 迭代序列数组
-    """
-    x = np.zeros(n)
-    x[0] = x0
-    for i in range(1, n):
-        x[i] = r * x[i-1] * (1 - x[i-1])
-    return x
+        参数:
+            r: 增长率参数
+            x0: 初始值
+            n: 迭代次数
+            
+        返回:
+            x: 迭代序列数组
+        """
+        x = np.empty(n)
+        x[0] = x0
+        for i in range(1, n):
+            x[i] = r * x[i-1] * (1 - x[i-1])
+        return x
+
+    @njit(parallel=True, fastmath=True)
+    def _bifurcation_orbits(r_values, n_iterations, n_discard, out):
+        # 各r值的轨道相互独立，按r并行迭代，out[k, j]为第j个r值的第n_discard+k次迭代
+        for j in prange(r_values.size):
+            r = r_values[j]
+            x = 0.5
+            for i in range(n_discard):
+                x = r * x * (1.0 - x)
+            for k in range(n_iterations - n_discard):
+                out[k, j] = x
+                x = r * x * (1.0 - x)
 
 def plot_time_series(r, x0, n):
     """
     绘制时间序列图
     
     参数:
-        r: 增长率参数
+        r: 增长率参数，可以是单个值或多个值组成的序列
         x0: 初始值
         n: 迭代次数
         
     返回:
         fig: matplotlib图像对象
     """
-    x = iterate_logistic(r, x0, n)
+    # 每列对应一个r值的时间序列，由编译后的iterate_logistic逐个生成
+    r_values = np.atleast_1d(np.asarray(r, dtype=np.float64))
+    out = np.column_stack([iterate_logistic(r_val, x0, n) for r_val in r_values])
     t = np.arange(n)
+    r_label = ', '.join(f'{r_val:g}' for r_val in r_values)
     
     fig, ax = plt.subplots(figsize=(10, 6))
-    ax.plot(t, x, 'b-', lw=1)
+    # 单个r值保持蓝色实线，多个r值使用默认颜色循环
+    fmt = 'b-' if r_values.size == 1 else '-'
+    lines = ax.plot(t, out, fmt, lw=1)
+    if len(lines) > 1:
+        ax.legend(lines, [f'r={r_val:g}' for r_val in r_values])
     ax.set_xlabel('迭代次数')
     ax.set_ylabel('x')
-    ax.set_title(f'Logistic映射时间序列 (r={r})')
+    ax.set_title(f'Logistic映射时间序列 (r={r_label})')
     ax.grid(True)
     
     return fig
@@ -58,21 +92,23 @@ def plot_bifurcation(r_min, r_max, n_r, n_iterations, n_discard):
         fig: matplotlib图像对象
     """
     r = np.linspace(r_min, r_max, n_r)
-    x = np.zeros(n_iterations)
-    x_plot = []
-    r_plot = []
+    out = np.empty((n_iterations - n_discard, n_r))
     
-    for r_val in r:
-        x[0] = 0.5
-        for i in range(1, n_iterations):
-            x[i] = r_val * x[i-1] * (1 - x[i-1])
-        
-        # 只保留稳定后的点
-        x_plot.extend(x[n_discard:])
-        r_plot.extend([r_val] * (n_iterations - n_discard))
+    # 只保留稳定后的点
+    _bifurcation_orbits(r, n_iterations, n_discard, out)
+    
+    # 统计点密度后以单张图像绘制，避免逐点构建路径；
+    # 每个r值各占一列，只需在x方向分箱，无需构造与out同形的r数组
+    n_bins = 800
+    valid = (out >= 0) & (out <= 1)
+    rows = np.minimum((np.where(valid, out, 0) * n_bins).astype(np.intp), n_bins - 1)
+    cols = np.arange(n_r)
+    H = np.bincount((cols * n_bins + rows)[valid],
+                    minlength=n_r * n_bins).reshape(n_r, n_bins)
     
     fig, ax = plt.subplots(figsize=(12, 8))
-    ax.plot(r_plot, x_plot, ',k', alpha=0.1, markersize=0.1)
+    ax.imshow(H.T, origin='lower', extent=[r_min, r_max, 0, 1],
+              aspect='auto', cmap='gray_r', norm=LogNorm())
     ax.set_xlabel('r')
     ax.set_ylabel('x')
     ax.set_title('Logistic映射分岔图')
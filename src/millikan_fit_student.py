@@ -3,6 +3,7 @@
 """
 
 import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 
 def load_data(filename):
@@ -21,7 +22,8 @@ def load_data(filename):
         ValueError: 数据格式错误
     """
     try:
-        data = np.loadtxt(filename)
+        data = pd.read_csv(filename, sep=r'\s+', header=None, comment='#',
+                           dtype=np.float64, engine='c').to_numpy()
     except FileNotFoundError:
         raise FileNotFoundError(f"错误：数据文件 '{filename}' 未找到") from None
     except Exception as e:
@@ -30,8 +32,8 @@ def load_data(filename):
     if data.shape[1] != 2:
         raise ValueError("数据文件必须包含且仅包含两列数据")
     
-    x = data[:, 0].astype(np.float64)
-    y = data[:, 1].astype(np.float64)
+    # 解析时已确定dtype，直接取列视图，无需再复制
+    x, y = data[:, 0], data[:, 1]
     
     # 数据有效性验证
     if len(x) == 0 or len(y) == 0:
@@ -75,22 +77,22 @@ def calculate_parameters(x, y):
     except ValueError:
         raise ValueError("输入数据必须为数值类型")
     
-    # 使用numpy内置函数提升计算稳定性
-    Ex = np.mean(x)
-    Ey = np.mean(y)
-    cov_xy = np.cov(x, y, ddof=0)[0][1]  # 总体协方差
-    var_x = np.var(x, ddof=0)            # 总体方差
+    # 统计量：点积直接求二阶矩，避免中间数组
+    N = x.size
+    Ex = x.mean()
+    Ey = y.mean()
+    Exx = (x @ x) / N
+    Exy = (x @ y) / N
     
-    # 检查方差有效性
-    if abs(var_x) < 1e-15:
+    # 检查方差有效性（x全部相同则无法拟合）
+    if np.ptp(x) == 0:
         raise ValueError("数据x值的方差为零，无法计算斜率")
     
-    # 计算参数
-    m = cov_xy / var_x
-    c = Ey - m * Ex
+    # 计算参数（LAPACK最小二乘求解）
+    m, c = np.polyfit(x, y, 1)
     
     # 返回兼容原有接口的统计量
-    return m, c, Ex, Ey, np.mean(x**2), np.mean(x*y)
+    return float(m), float(c), Ex, Ey, Exx, Exy
 
 def plot_data_and_fit(x, y, m, c):
     """
@@ -114,8 +116,8 @@ def plot_data_and_fit(x, y, m, c):
     fig = plt.figure(figsize=(8, 6))
     plt.scatter(x, y, color="blue", label="实验数据", zorder=10)
     
-    # 生成平滑拟合曲线
-    x_fit = np.linspace(np.min(x), np.max(x), 100)
+    # 直线只需两个端点
+    x_fit = np.array([np.min(x), np.max(x)])
     y_fit = m * x_fit + c
     plt.plot(x_fit, y_fit, color="red", linewidth=1.5, label="拟合直线")
     
@@ -146,11 +148,8 @@ def calculate_planck_constant(m):
     e = 1.602e-19  # 电子电荷 (单位：C)
     h_actual = 6.62607015e-34  # 标准值 (单位：J·s)
     
-    try:
-        h = m * e
-        relative_error = abs(h - h_actual) / h_actual * 100
-    except Exception as e:
-        raise RuntimeError(f"计算普朗克常量失败: {str(e)}") from None
+    h = float(m) * e  # 普朗克常量按双精度计算
+    relative_error = abs(h - h_actual) / h_actual * 100
     
     return h, relative_error
 
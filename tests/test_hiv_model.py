@@ -1,5 +1,9 @@
+import os
+import tempfile
 import unittest
+from unittest import mock
 import numpy as np
+from src import hiv_model_student
 from src.hiv_model_student import HIVModel, load_hiv_data
 #from solutions.hiv_model_solution import HIVModel, load_hiv_data
 
@@ -14,10 +18,33 @@ class TestHIVModel(unittest.TestCase):
         result = model.viral_load(time)
         self.assertEqual(len(result), 100)
 
+    def test_viral_load_cache(self):
+        model = HIVModel(A=1000, alpha=0.5, B=500, beta=0.1)
+        time = np.linspace(0, 10, 100)
+        with mock.patch('src.hiv_model_student._viral_load',
+                        wraps=hiv_model_student._viral_load) as kernel:
+            first = model.viral_load(time)
+            first *= 2
+            np.testing.assert_allclose(model.viral_load(time) * 2, first)
+            self.assertEqual(kernel.call_count, 1)
+            model.alpha = 0.2
+            np.testing.assert_allclose(model.viral_load(time),
+                                       1000 * np.exp(-0.2 * time) + 500 * np.exp(-0.1 * time))
+            self.assertEqual(kernel.call_count, 2)
+
     def test_data_loading(self):
         time, load = load_hiv_data('data/HIVseries.csv')
         self.assertGreater(len(time), 0)
         self.assertGreater(len(load), 0)
 
+    def test_data_loading_with_comments(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, 'commented.csv')
+            with open(filepath, 'w') as f:
+                f.write("# time_in_days, viral_load\n0, 1.061e+05\n0.0831, 93240\n")
+            time, load = load_hiv_data(filepath)
+        self.assertEqual(len(time), 2)
+        self.assertAlmostEqual(load[1], 93240)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
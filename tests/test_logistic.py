@@ -44,6 +44,19 @@ def test_plot_time_series():
     
     plt.close(fig)
 
+def test_plot_time_series_multiple_r():
+    """测试多个r值同时绘制时间序列"""
+    r_values = [2.0, 3.2, 3.45, 3.6]
+    fig = plot_time_series(r_values, 0.5, 60)
+    
+    ax = fig.get_axes()[0]
+    lines = ax.get_lines()
+    assert len(lines) == len(r_values), "每个r值应对应一条线"
+    for line, r in zip(lines, r_values):
+        assert np.allclose(line.get_ydata(), iterate_logistic(r, 0.5, 60)), "时间序列应与逐个迭代结果一致"
+    
+    plt.close(fig)
+
 def test_plot_bifurcation():
     """测试分岔图绘制函数"""
     fig = plot_bifurcation(3.0, 3.6, 100, 100, 50)
@@ -91,6 +91,15 @@ def test_plot_data_and_fit():
     # 关闭图像以避免显示
     plt.close(fig)
 
+def test_load_data_with_comments(tmp_path):
+    """测试带#注释行的数据文件"""
+    data_file = tmp_path / "commented.txt"
+    data_file.write_text("# freq volt\n5.4874e+14 0.5309\n6.931e+14 1.0842  # 第二个点\n")
+    x, y = load_data(str(data_file))
+    
+    assert len(x) == 2, "注释行应被跳过"
+    assert np.allclose(y, [0.5309, 1.0842]), "行尾注释应被忽略"
+
 def test_load_data_invalid_file():
     """测试加载不存在文件时的异常处理"""
     with pytest.raises(FileNotFoundError):